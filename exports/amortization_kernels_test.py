@@ -0,0 +1,89 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import mortgage_calculator_new as mc
+
+# (loan amount, annual interest rate %, term years, extra monthly payment)
+AMORTIZATION_CASES = {
+    'normal': (300_000, 4.5, 30, 0),
+    'extra_payment': (300_000, 4.5, 30, 500),
+    'zero_rate': (120_000, 0.0, 10, 250),
+    'single_month_payoff': (1_000, 4.5, 1, 5_000),
+    'above_float32_limit': (12_000_000, 3.5, 25, 10_000),
+}
+
+# (loan amount, monthly rate, years, monthly principal + extra, monthly fee)
+YEARLY_CASES = {
+    'normal': (255_000, 0.045 / 12, 23, 925, 0),
+    'extra_payment': (255_000, 0.045 / 12, 15, 1_425, 150),
+    'zero_rate': (120_000, 0.0, 10, 1_000, 150),
+    'single_month_payoff': (1_000, 0.045 / 12, 1, 5_000, 0),
+    'above_float32_limit': (12_000_000, 0.035 / 12, 25, 40_000, 500),
+}
+
+
+def baseline_yearly_breakdown(loan_amount, monthly_rate, years, P, monthly_fee):
+    """Yearly interest and totals as the original nested year/month loop computed them"""
+    yearly_interest = []
+    yearly_total = []
+    remaining_balance = loan_amount
+    for _ in range(years):
+        yearly_interest_total = 0
+        for _ in range(12):
+            if remaining_balance <= 0:
+                break
+            yearly_interest_total += remaining_balance * monthly_rate
+            remaining_balance -= P
+        yearly_interest.append(yearly_interest_total)
+        yearly_total.append(P * 12 + yearly_interest_total + monthly_fee * 12)
+    return np.array(yearly_interest), np.array(yearly_total)
+
+
+class AmortizationKernelTest(unittest.TestCase):
+    """The loop, closed-form and selected amortization kernels must fill identical schedules"""
+
+    def run_kernel(self, kernel, loan_amount, interest_rate, term_years, extra_payment):
+        monthly_rate = interest_rate / 100 / 12
+        months = term_years * 12
+        payment = mc._monthly_payment(float(loan_amount), monthly_rate, months)
+        columns = [np.empty(months) for _ in range(4)]
+        n = kernel(float(loan_amount), monthly_rate, months, payment, float(extra_payment), 150.0, *columns)
+        return n, [column[:n] for column in columns]
+
+    def test_kernels_agree(self):
+        for name, case in AMORTIZATION_CASES.items():
+            with self.subTest(name):
+                n_loop, expected = self.run_kernel(mc._amortize_loop, *case)
+                for kernel in (mc._amortize_closed_form, mc._amortize):
+                    n, columns = self.run_kernel(kernel, *case)
+                    self.assertEqual(n, n_loop)
+                    for column, expected_column in zip(columns, expected):
+                        np.testing.assert_allclose(column, expected_column, rtol=1e-9, atol=1e-6)
+
+    def test_single_month_payoff_clears_balance(self):
+        n, (payments, _, _, balance) = self.run_kernel(mc._amortize_closed_form, *AMORTIZATION_CASES['single_month_payoff'])
+        self.assertEqual(n, 1)
+        self.assertEqual(balance[0], 0.0)
+        self.assertAlmostEqual(payments[0], 1_000 + 150.0)
+
+
+class YearlyBreakdownKernelTest(unittest.TestCase):
+    """The loop, vectorized and selected yearly kernels must match the original nested loop"""
+
+    def test_kernels_match_baseline(self):
+        for name, case in YEARLY_CASES.items():
+            with self.subTest(name):
+                loan_amount, monthly_rate, years, P, monthly_fee = case
+                expected_interest, expected_total = baseline_yearly_breakdown(*case)
+                for kernel in (mc._yearly_breakdown_loop, mc._yearly_breakdown_vectorized, mc._yearly_breakdown):
+                    interest, total = kernel(float(loan_amount), monthly_rate, years, float(P), float(monthly_fee))
+                    np.testing.assert_allclose(interest, expected_interest, rtol=1e-9, atol=1e-6)
+                    np.testing.assert_allclose(total, expected_total, rtol=1e-9, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
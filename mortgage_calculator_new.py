@@ -6,14 +6,160 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib import fonts
 import os
+import io
+import re
+import math
+import functools
 from datetime import datetime
 from ttkbootstrap import Style
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from tkinter import filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the NumPy closed form is used instead
+    njit = None
+
+# Amortization Kernels
+def _amortize_loop(P, r, months, payment, extra, fee,
+                   out_payment, out_principal, out_interest, out_balance):
+    """Fill the schedule columns month by month and return the payoff month"""
+    balance = P
+    n = 0
+    for m in range(months):
+        if balance <= 0:
+            break
+
+        interest = balance * r
+        principal = payment - interest
+        total_payment = principal + extra
+
+        if total_payment > balance:
+            total_payment = balance
+
+        balance -= total_payment
+
+        out_payment[m] = total_payment + fee
+        out_principal[m] = principal
+        out_interest[m] = interest
+        out_balance[m] = balance
+        n += 1
+    return n
+
+def _amortize_closed_form(P, r, months, payment, extra, fee,
+                          out_payment, out_principal, out_interest, out_balance):
+    """Fill the schedule columns with NumPy arrays and return the payoff month"""
+    if P <= 0 or months <= 0:
+        return 0
+
+    # Closed-form balance after each month for a constant payment
+    month = np.arange(1, months + 1)
+    if r == 0:
+        balance = P - (payment + extra) * month
+    else:
+        annuity = (payment + extra) / r
+        balance = (P - annuity) * (1 + r) ** month + annuity
+
+    # Work in float64 and only round when storing into the output columns
+    previous_balance = np.concatenate(([P], balance[:-1]))
+    interest = previous_balance * r
+    principal = payment - interest
+    total_payment = principal + extra
+
+    # Truncate at the payoff month (balance is strictly decreasing)
+    n = min(int(np.searchsorted(-balance, 0)) + 1, months)
+
+    # The final payment only covers what is left of the balance
+    if balance[n - 1] < 0:
+        total_payment[n - 1] = previous_balance[n - 1]
+        balance[n - 1] = 0.0
+
+    out_payment[:] = total_payment + fee
+    out_principal[:] = principal
+    out_interest[:] = interest
+    out_balance[:] = balance
+    return n
+
+if njit is not None:
+    _amortize = njit(cache=True, fastmath=True)(_amortize_loop)
+else:
+    _amortize = _amortize_closed_form
+
+def _yearly_breakdown_loop(loan_amount, monthly_rate, years, P, monthly_fee):
+    """Accumulate yearly interest and totals month by month for a linear paydown"""
+    yearly_interest = np.zeros(years)
+    yearly_total = np.zeros(years)
+    balance = loan_amount
+    for y in range(years):
+        interest = 0.0
+        for _ in range(12):
+            if balance <= 0:
+                break
+            interest += balance * monthly_rate
+            balance -= P
+        yearly_interest[y] = interest
+        yearly_total[y] = (P + monthly_fee) * 12 + interest
+    return yearly_interest, yearly_total
+
+def _yearly_breakdown_vectorized(loan_amount, monthly_rate, years, P, monthly_fee):
+    """Compute yearly interest and totals for a linear paydown with NumPy arrays"""
+    # Interest accrues monthly on the balance until it reaches zero
+    balances = np.maximum(loan_amount - np.arange(years * 12) * P, 0.0)
+    yearly_interest = (balances * monthly_rate).reshape(years, 12).sum(axis=1)
+    return yearly_interest, (P + monthly_fee) * 12 + yearly_interest
+
+if njit is not None:
+    _yearly_breakdown = njit(cache=True)(_yearly_breakdown_loop)
+else:
+    _yearly_breakdown = _yearly_breakdown_vectorized
+
+# Memoized Calculations (keyed by the loan inputs)
+_SCHEDULE_COLUMNS = ('month', 'payment', 'principal', 'interest', 'balance', 'extra_payment', 'fee')
+
+# Schedule columns are float32 up to this amount and float64 above it. float32 storage is
+# display precision only: values round to within half a float32 step, which is under a
+# cent below 65k but grows to about 0.25 at 5M and 0.50 at 10M (totals are summed in float64)
+_FLOAT32_MAX_LOAN = 10_000_000
+
+@functools.lru_cache(maxsize=256)
+def _monthly_payment(loan_amount, monthly_rate, months):
+    """Calculate base monthly payment using standard formula"""
+    if monthly_rate == 0:
+        return loan_amount / months
+    # 1 - (1 + r)^-n evaluated as -expm1(-n*log1p(r)) stays accurate for tiny rates
+    return loan_amount * monthly_rate / -math.expm1(-months * math.log1p(monthly_rate))
+
+@functools.lru_cache(maxsize=64)
+def _amortize_cached(loan_amount, interest_rate, term_years, extra_payment, monthly_fee):
+    """Build the schedule once per input tuple; cached arrays are read-only"""
+    monthly_rate = interest_rate / 100 / 12
+    months = term_years * 12
+    payment = _monthly_payment(loan_amount, monthly_rate, months)
+
+    # Preallocate the schedule columns once and let the kernel fill them
+    dtype = np.float32 if loan_amount <= _FLOAT32_MAX_LOAN else np.float64
+    payments = np.empty(months, dtype=dtype)
+    principal = np.empty(months, dtype=dtype)
+    interest = np.empty(months, dtype=dtype)
+    balance = np.empty(months, dtype=dtype)
+    n = _amortize(loan_amount, monthly_rate, months, payment, extra_payment, monthly_fee,
+                  payments, principal, interest, balance)
+
+    # No extra payment is needed once the final payment clears the loan
+    extra_payments = np.full(n, extra_payment, dtype=dtype)
+    if n and balance[n - 1] <= 0:
+        extra_payments[n - 1] = 0.0
+
+    columns = (np.arange(1, n + 1), payments[:n], principal[:n], interest[:n],
+               balance[:n], extra_payments, np.full(n, monthly_fee, dtype=dtype))
+    for column in columns:
+        column.flags.writeable = False
+
+    # Keep the total in float64 for accuracy
+    return (n, float(interest[:n].sum(dtype=np.float64))) + columns
+
 # Mortgage Calculation Engine (Business Logic)
 class MortgageCalculatorEngine:
     def __init__(self):
@@ -25,59 +171,105 @@ class MortgageCalculatorEngine:
 
     def calculate_amortization(self) -> dict:
         """Calculate full amortization schedule with optional extra payments"""
-        monthly_rate = self.interest_rate / 100 / 12
-        months = self.term_years * 12
-        payment = self.calculate_monthly_payment(monthly_rate, months)
-        
-        schedule = []
-        balance = self.loan_amount
-        total_interest = 0.0
-        
-        for month in range(1, months + 1):
-            if balance <= 0:
-                break
-                
-            interest = balance * monthly_rate
-            principal = payment - interest
-            total_payment = principal + self.extra_payment
-            
-            if total_payment > balance:
-                total_payment = balance
-                self.extra_payment = 0
-                
-            balance -= total_payment
-            total_interest += interest
-            
-            schedule.append({
-                'month': month,
-                'payment': total_payment + self.monthly_fee,
-                'principal': principal,
-                'interest': interest,
-                'balance': balance,
-                'extra_payment': self.extra_payment,
-                'fee': self.monthly_fee
-            })
-            
+        n, total_interest, *columns = _amortize_cached(
+            float(self.loan_amount), float(self.interest_rate), int(self.term_years),
+            float(self.extra_payment), float(self.monthly_fee))
+
         return {
-            'schedule': schedule,
+            'schedule': dict(zip(_SCHEDULE_COLUMNS, columns)),
             'total_interest': total_interest,
-            'final_payment_month': len(schedule)
+            'final_payment_month': n
         }
 
     def calculate_monthly_payment(self, monthly_rate: float, months: int) -> float:
         """Calculate base monthly payment using standard formula"""
-        if monthly_rate == 0:
-            return self.loan_amount / months
-        return (self.loan_amount * monthly_rate * (1 + monthly_rate)**months) / \
-               ((1 + monthly_rate)**months - 1)
+        return _monthly_payment(float(self.loan_amount), monthly_rate, months)
+
+# Input Parsing
+_NUMERIC_INPUTS = ('loan_seeking', 'down_payment', 'interest_rate',
+                   'principal_payment', 'extra_payment', 'monthly_fee')
+
+# Multi-character currency symbols are only removed as a whole prefix or suffix
+_CURRENCY_AFFIX = re.compile(r'^(?:kr|C\$|A\$)|(?:kr|C\$|A\$)$')
+
+# Strips single-character currency symbols and spaces, and maps decimal commas to periods
+_NUMBER_TRANSLATION = str.maketrans({
+    '$': None, '€': None, '£': None, '¥': None, '₹': None, ' ': None, ',': '.'
+})
+
+@functools.lru_cache(maxsize=256)
+def _parse_float(value_str):
+    """Convert an input string to float; cached by the raw string"""
+    # Remove currency symbols and spaces, and use periods for decimal commas
+    cleaned_str = _CURRENCY_AFFIX.sub('', value_str.strip()).translate(_NUMBER_TRANSLATION)
+    # Keep the first period and drop any that follow it
+    whole, period, fraction = cleaned_str.partition('.')
+    cleaned_str = whole + period + fraction.replace('.', '')
+    if not cleaned_str:
+        return 0.0
+    return float(cleaned_str)
+
+# Result Display Defaults (the Monthly House Fee var is shared with the inputs)
+_DEFAULT_DISPLAY = (
+    ('monthly_payment_var', 'kr0'),
+    ('total_interest_var', 'kr0'),
+    ('monthly_principal_var', 'kr0'),
+    ('monthly_extra_var', 'kr0'),
+    ('monthly_total_principal_var', 'kr0'),
+    ('monthly_interest_var', 'kr0'),
+    ('monthly_total_var', 'kr0'),
+    ('time_saved_var', '0 years, 0 months'),
+    ('interest_saved_var', 'kr0'),
+    ('loan_payoff_time_var', '0 years, 0 months'),
+)
+
+# Theme Setup (done once per process)
+@functools.lru_cache(maxsize=1)
+def _install_style():
+    """Load the ttkbootstrap theme and configure the widget styles"""
+    colors = MortgageCalculator.colors
+    style = Style(theme='litera')
+    style.configure('.', font=('Inter', 11))
+
+    # Configure widget styles
+    style.configure('TFrame', background=colors['zinc-50'])
+    style.configure('TLabel', background=colors['zinc-50'], 
+                    foreground=colors['zinc-800'], padding=4)
+    style.configure('TButton', padding=8, relief='flat')
+    style.configure('Primary.TButton', background=colors['sky-600'],
+                    foreground='white', font=('Inter', 11, 'bold'))
+    style.map('TButton',
+              background=[('active', colors['sky-600']), 
+                          ('disabled', colors['zinc-100'])],
+              foreground=[('active', 'white'), ('disabled', colors['zinc-800'])])
+    return style
 
 # Main Application Class (GUI Layer)
 class MortgageCalculator:
+    # Extended Tailwind CSS color palette
+    colors = {
+        'zinc-50': '#fafafa',
+        'zinc-100': '#f4f4f5', 
+        'zinc-200': '#e4e4e7',
+        'zinc-400': '#a1a1aa',
+        'zinc-600': '#52525b',
+        'zinc-800': '#18181b',  # Darker zinc-800 for better contrast
+        'emerald-500': '#10b981',
+        'emerald-600': '#059669',
+        'emerald-700': '#047857',
+        'sky-500': '#0ea5e9', 
+        'sky-600': '#0284c7',   # Added sky-600 for secondary elements
+        'sky-700': '#0369a1',
+        'stone-200': '#e7e5e4'
+    }
+    # Yearly chart bar width and offsets from each year's tick
+    _WIDTH = 0.2
+    _OFF_LEFT = -0.1   # base principal with extra principal stacked on top
+    _OFF_MID = 0.1     # interest
+    _OFF_RIGHT = 0.3   # total
+
     def __init__(self, root: tk.Tk):
         """Initialize the calculator"""
-        # Initialize tooltips dictionary first
-        self.tooltips = {}
-        
         self.root = root
         self.root.title("Modern Mortgage Calculator")
 
@@ -87,38 +279,19 @@ class MortgageCalculator:
         self.root.bind('<Control-e>', lambda e: self.export_pdf())
         self.root.bind('<Escape>', lambda e: self.root.quit())
 
-        # Configure Tailwind-inspired theme
-        self.style = Style(theme='litera')
-        self.style.configure('.', font=('Inter', 11))
-        
-        # Extended Tailwind CSS color palette
-        self.colors = {
-            'zinc-50': '#fafafa',
-            'zinc-100': '#f4f4f5', 
-            'zinc-200': '#e4e4e7',
-            'zinc-400': '#a1a1aa',
-            'zinc-600': '#52525b',
-            'zinc-800': '#18181b',  # Darker zinc-800 for better contrast
-            'emerald-500': '#10b981',
-            'emerald-600': '#059669',
-            'emerald-700': '#047857',
-            'sky-500': '#0ea5e9', 
-            'sky-600': '#0284c7',   # Added sky-600 for secondary elements
-            'sky-700': '#0369a1',
-            'stone-200': '#e7e5e4'
-        }
+        # Configure Tailwind-inspired theme (shared by all instances)
+        self.style = _install_style()
 
-        # Configure widget styles
-        self.style.configure('TFrame', background=self.colors['zinc-50'])
-        self.style.configure('TLabel', background=self.colors['zinc-50'], 
-                           foreground=self.colors['zinc-800'], padding=4)
-        self.style.configure('TButton', padding=8, relief='flat')
-        self.style.configure('Primary.TButton', background=self.colors['sky-600'],
-                           foreground='white', font=('Inter', 11, 'bold'))
-        self.style.map('TButton',
-                      background=[('active', self.colors['sky-600']), 
-                                 ('disabled', self.colors['zinc-100'])],
-                      foreground=[('active', 'white'), ('disabled', self.colors['zinc-800'])])
+        # Create one hidden tooltip window shared by all widgets
+        self._tip = tk.Toplevel(self.root)
+        self._tip.wm_overrideredirect(True)
+        self._tip.withdraw()
+        self._tip_label = ttk.Label(self._tip, justify='left',
+                                    background=self.colors['zinc-50'],
+                                    relief='solid', borderwidth=1,
+                                    font=("Inter", 8),
+                                    padding=(5, 2))
+        self._tip_label.pack()
 
         # Set window size for 14" laptop screen
         self.root.geometry("1200x800")
@@ -147,12 +320,18 @@ class MortgageCalculator:
         bottom_frame = ttk.Frame(main_frame)
         bottom_frame.pack(fill='both', expand=True, pady=10)
 
+        # Debounced trace state and the currency used for formatting
+        self._pending_updates = {}
+        self._setting_down_payment = False
+        self._cur = "kr"
+
         # Initialize variables and create panels
         self.initialize_variables()
         self.create_panels(left_frame, right_frame, bottom_frame)
-        
-        # Create tooltips dictionary to store tooltip instances
-        self.tooltips = {}
+
+        # Compile (or load from cache) the numba kernel while the window is idle
+        if njit is not None:
+            self.root.after_idle(_yearly_breakdown, 0.0, 0.0, 1, 0.0, 0.0)
 
     def create_tooltip(self, widget, text):
         """Create a tooltip for a given widget with the given text"""
@@ -160,29 +339,15 @@ class MortgageCalculator:
             x, y, _, _ = widget.bbox("insert")
             x += widget.winfo_rootx() + 25
             y += widget.winfo_rooty() + 20
-            
-            # Create a toplevel window
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{x}+{y}")
-            
-            # Create tooltip label
-            label = ttk.Label(tooltip, text=text, justify='left',
-                            background=self.colors['zinc-50'],
-                            relief='solid', borderwidth=1,
-                            font=("Inter", 8),
-                            padding=(5, 2))
-            label.pack()
-            
-            # Store the tooltip
-            self.tooltips[widget] = tooltip
-            
+
+            # Reuse the shared tooltip window
+            self._tip_label.configure(text=text)
+            self._tip.wm_geometry(f"+{x}+{y}")
+            self._tip.deiconify()
+
         def leave(event):
-            # Destroy the tooltip if it exists
-            if widget in self.tooltips:
-                self.tooltips[widget].destroy()
-                del self.tooltips[widget]
-                
+            self._tip.withdraw()
+
         # Bind the tooltip to the widget
         widget.bind('<Enter>', enter)
         widget.bind('<Leave>', leave)
@@ -194,11 +359,10 @@ class MortgageCalculator:
         self.create_loan_details_panel(left_frame)
         self.create_calculate_panel(left_frame)
 
-        # Right column panels
-        self.create_results_panel(right_frame)
-
-        # Bottom visualization panel
-        self.create_visualization_panel(bottom_frame)
+        # Right column and bottom visualization panels are built once the
+        # window is idle so the input panels paint first
+        self.root.after_idle(self.create_results_panel, right_frame)
+        self.root.after_idle(self.create_visualization_panel, bottom_frame)
 
     def center_window(self):
         """Center the window on screen"""
@@ -310,7 +474,8 @@ class MortgageCalculator:
         # Entry Field
         self.down_payment_entry = ttk.Entry(down_payment_frame, textvariable=self.down_payment_var, width=18)
         self.down_payment_entry.pack(side='right', fill='x', expand=True)
-        self.down_payment_entry.configure(state='disabled')
+        self._dp_state = None
+        self._set_dp_state('disabled')
 
         # Bind the down payment entry to update loan amount when value changes
         self.down_payment_var.trace_add('write', self.update_loan_amount)
@@ -493,18 +658,38 @@ class MortgageCalculator:
         self.plot_container = ttk.Frame(visualization_frame, width=30, height=576)
         self.plot_container.pack(fill='both', expand=True)
         
-        # Initialize matplotlib components
-        self.figure = plt.Figure(figsize=(8, 5), dpi=100)
+        # Initialize matplotlib components (imported here to keep startup fast)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(8, 5), dpi=100)
         self.ax = self.figure.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.figure, self.plot_container)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
+        # Static styling is applied once; redraws only replace the bars
+        self.ax.set_xlabel('Year')
+        self.ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+
+        # Bar artists are animated so recalculations can blit them over a cached background;
+        # the y axis (with its grid), spines and legend are animated too so they stay on top
+        self._animate_overlays()
+        self._bars = None
+        self._bg = None
+        # Year tick labels and bar positions are built once per year count
+        self._xtick_cache = {}
+        self._x_cache = {}
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+
     # STEP 5: Input Validation
     def validate_inputs(self):
         """Validate all input fields"""
         try:
+            values = self._read_floats(_NUMERIC_INPUTS)
+
             # Validate loan seeking amount with realistic limits
-            loan_seeking = self.get_float_value(self.loan_seeking_var.get())
+            loan_seeking = values['loan_seeking']
             if loan_seeking <= 0:
                 messagebox.showerror("Error", "Loan seeking amount must be greater than 0")
                 return False
@@ -513,7 +698,7 @@ class MortgageCalculator:
                 return False
 
             # Validate down payment
-            down_payment = self.get_float_value(self.down_payment_var.get())
+            down_payment = values['down_payment']
             if down_payment < 0:
                 messagebox.showerror("Error", "Down payment cannot be negative")
                 return False
@@ -522,7 +707,7 @@ class MortgageCalculator:
                 return False
 
             # Validate interest rate with realistic limits
-            interest_rate = self.get_float_value(self.interest_rate_var.get())
+            interest_rate = values['interest_rate']
             if interest_rate <= 0:
                 messagebox.showerror("Error", "Interest rate must be greater than 0")
                 return False
@@ -531,19 +716,19 @@ class MortgageCalculator:
                 return False
 
             # Validate principal payment
-            principal_payment = self.get_float_value(self.principal_payment_var.get())
+            principal_payment = values['principal_payment']
             if principal_payment < 0:
                 messagebox.showerror("Error", "Principal payment cannot be negative")
                 return False
 
             # Validate extra payment
-            extra_payment = self.get_float_value(self.extra_payment_var.get())
+            extra_payment = values['extra_payment']
             if extra_payment < 0:
                 messagebox.showerror("Error", "Extra payment cannot be negative")
                 return False
 
             # Validate monthly fee
-            monthly_fee = self.get_float_value(self.monthly_fee_var.get())
+            monthly_fee = values['monthly_fee']
             if monthly_fee < 0:
                 messagebox.showerror("Error", "Monthly house fee cannot be negative")
                 return False
@@ -557,20 +742,24 @@ class MortgageCalculator:
     # STEP 6: Calculation Logic
     def calculate(self):
         """Calculate mortgage payments and update display"""
+        # The calculation recomputes the loan amount from the current inputs
+        self._cancel_pending_updates()
+
         if not self.validate_inputs():
             return
 
         try:
             # Get and validate values from inputs
-            loan_seeking = self.get_float_value(self.loan_seeking_var.get())
+            values = self._read_floats(_NUMERIC_INPUTS)
+            loan_seeking = values['loan_seeking']
             
             # Calculate or get down payment based on mode
             if self.down_payment_mode.get() == "auto":
                 # Calculate 15% down payment
                 down_payment = loan_seeking * 0.15
-                self.down_payment_var.set(f"{down_payment:,.0f}")
+                self._set_down_payment(f"{down_payment:,.0f}")
             else:
-                down_payment = self.get_float_value(self.down_payment_var.get())
+                down_payment = values['down_payment']
             
             # Validate down payment
             if down_payment >= loan_seeking:
@@ -586,14 +775,14 @@ class MortgageCalculator:
             self.current_values['loan_seeking'] = float(loan_seeking)
             self.current_values['down_payment'] = float(down_payment)
             self.current_values['loan_amount'] = float(loan_amount)
-            interest_rate = self.get_float_value(self.interest_rate_var.get())
-            principal_payment = self.get_float_value(self.principal_payment_var.get())
-            extra_payment = self.get_float_value(self.extra_payment_var.get() or "0")
-            monthly_fee = self.get_float_value(self.monthly_fee_var.get())
+            interest_rate = values['interest_rate']
+            principal_payment = values['principal_payment']
+            extra_payment = values['extra_payment']
+            monthly_fee = values['monthly_fee']
 
             # Calculate monthly rate and base payment
             monthly_rate = interest_rate / 100 / 12
-            base_monthly = (loan_amount * monthly_rate) / (1 - (1 + monthly_rate) ** -360)
+            base_monthly = (loan_amount * monthly_rate) / -math.expm1(-360 * math.log1p(monthly_rate))
 
             # Calculate monthly interest
             monthly_interest = loan_amount * monthly_rate
@@ -609,14 +798,12 @@ class MortgageCalculator:
                 total_monthly_payment = principal_payment + extra_payment
                 months_with_extra = int(loan_amount / total_monthly_payment)
                 
-                # Calculate interest savings
-                total_interest_with_extra = 0
-                remaining_balance = loan_amount
-                for _ in range(months_with_extra):
-                    interest = remaining_balance * monthly_rate
-                    total_interest_with_extra += interest
-                    remaining_balance -= total_monthly_payment
-                
+                # Calculate interest savings (closed-form sum over the linear paydown)
+                total_interest_with_extra = (
+                    months_with_extra * loan_amount * monthly_rate
+                    - monthly_rate * total_monthly_payment * months_with_extra * (months_with_extra - 1) / 2
+                )
+
                 interest_saved = total_interest - total_interest_with_extra
                 years_to_payoff = months_with_extra // 12
                 months_to_payoff = months_with_extra % 12
@@ -632,20 +819,20 @@ class MortgageCalculator:
                 years_saved = months_saved = 0
                 interest_saved = 0
 
-            # Get currency symbol
-            currency = self.currency_var.get()
+            # Get currency symbol once for all formatted amounts
+            currency = self._cur = self.currency_var.get()
 
             # Update display values
-            self.monthly_payment_var.set(f"{self.currency_var.get()}{total_monthly:,.0f}")
-            self.total_interest_var.set(f"{self.currency_var.get()}{total_interest:,.0f}")
-            self.monthly_principal_var.set(f"{currency}{principal_payment:,.0f}")
-            self.monthly_extra_var.set(f"{currency}{extra_payment:,.0f}")
-            self.monthly_total_principal_var.set(f"{currency}{(principal_payment + extra_payment):,.0f}")
-            self.monthly_interest_var.set(f"{currency}{monthly_interest:,.0f}")
+            self.monthly_payment_var.set(self._fmt(total_monthly))
+            self.total_interest_var.set(self._fmt(total_interest))
+            self.monthly_principal_var.set(self._fmt(principal_payment))
+            self.monthly_extra_var.set(self._fmt(extra_payment))
+            self.monthly_total_principal_var.set(self._fmt(principal_payment + extra_payment))
+            self.monthly_interest_var.set(self._fmt(monthly_interest))
             self.monthly_fee_var.set(f"{monthly_fee:,.0f}")
-            self.monthly_total_var.set(f"{currency}{total_monthly:,.0f}")
+            self.monthly_total_var.set(self._fmt(total_monthly))
             self.time_saved_var.set(f"{years_saved} years, {months_saved} months")
-            self.interest_saved_var.set(f"{currency}{interest_saved:,.0f}")
+            self.interest_saved_var.set(self._fmt(interest_saved))
             self.loan_payoff_time_var.set(f"{years_to_payoff} years, {months_to_payoff} months")
 
             # Store values for PDF export with proper formatting
@@ -680,84 +867,195 @@ class MortgageCalculator:
             messagebox.showerror("Error", f"An error occurred during calculation: {str(e)}")
             return False
 
+    def _fmt(self, value):
+        """Format an amount with the currency symbol read at the start of calculate()"""
+        return f"{self._cur}{value:,.0f}"
+
     def update_yearly_visualization(self, loan_amount, monthly_rate, years, principal_payment, extra_payment, monthly_fee):
         """Update the visualization with yearly payment breakdown"""
-        self.ax.clear()
-
         # Calculate yearly totals
         years_range = range(1, years + 1) if years > 0 else range(1, 2)
+        n_years = len(years_range)
         base_principal = principal_payment * 12
         extra_principal = extra_payment * 12
-        yearly_base_principal = [base_principal] * len(years_range)
-        yearly_extra_principal = [extra_principal] * len(years_range)
-        yearly_interest = []
-        yearly_total = []
-        
-        remaining_balance = loan_amount
-        for _ in years_range:
-            yearly_interest_total = 0
-            for _ in range(12):
-                if remaining_balance <= 0:
-                    break
-                monthly_interest = remaining_balance * monthly_rate
-                yearly_interest_total += monthly_interest
-                remaining_balance -= (principal_payment + extra_payment)
-            yearly_interest.append(yearly_interest_total)
-            yearly_total.append(base_principal + extra_principal + yearly_interest_total + (monthly_fee * 12))
+        yearly_base_principal = np.full(n_years, base_principal)
+        yearly_extra_principal = np.full(n_years, extra_principal)
+        yearly_interest, yearly_total = _yearly_breakdown(
+            float(loan_amount), float(monthly_rate), n_years,
+            float(principal_payment + extra_payment), float(monthly_fee))
+
+        series = {
+            'base': yearly_base_principal,
+            'extra': yearly_extra_principal,
+            'int': yearly_interest,
+            'tot': yearly_total
+        }
+
+        # Same number of years: reuse the existing bars and only update their heights
+        currency = self.currency_var.get()
+        if self._bars is not None and len(self._bars['base']) == n_years:
+            ylim = self.ax.get_ylim()
+            self._set_bar_heights(series)
+            self.ax.relim()
+            self.ax.autoscale_view()
+
+            ylabel = f'Amount ({currency})'
+            if self._bg is not None and self.ax.get_ylim() == ylim and self.ax.get_ylabel() == ylabel:
+                self._blit_bars()
+            else:
+                # Limits or label changed: schedule one full redraw and blit again after it
+                self.ax.set_ylabel(ylabel)
+                self.figure.tight_layout()
+                self._request_redraw()
+            return
+
+        self._remove_bars()
 
         # Create the bar plot
-        x = np.arange(len(years_range))
-        width = 0.2
+        x, x_left, x_mid, x_right = self._bar_positions(n_years)
+        width = self._WIDTH
 
         # Plot base principal and stack extra payment on top
-        base_bars = self.ax.bar(x - width*0.5, yearly_base_principal, width, label='Base Principal', color='#2ecc71')
-        extra_bars = self.ax.bar(x - width*0.5, yearly_extra_principal, width, label='Extra Principal', color='#FFA500', bottom=yearly_base_principal)
+        base_bars = self.ax.bar(x_left, yearly_base_principal, width, label='Base Principal', color='#2ecc71', animated=True)
+        extra_bars = self.ax.bar(x_left, yearly_extra_principal, width, label='Extra Principal', color='#FFA500', bottom=yearly_base_principal, animated=True)
         
         # Plot interest and total bars separately
-        self.ax.bar(x + width*0.5, yearly_interest, width, label='Interest', color='#e74c3c')
-        self.ax.bar(x + width*1.5, yearly_total, width, label='Total', color='#3498db')
+        interest_bars = self.ax.bar(x_mid, yearly_interest, width, label='Interest', color='#e74c3c', animated=True)
+        total_bars = self.ax.bar(x_right, yearly_total, width, label='Total', color='#3498db', animated=True)
+        self._bars = {'base': base_bars, 'extra': extra_bars, 'int': interest_bars, 'tot': total_bars}
 
         # Customize plot
-        currency = self.currency_var.get()
         self.ax.set_ylabel(f'Amount ({currency})')
-        self.ax.set_xlabel('Year')
         self.ax.set_xticks(x)
-        self.ax.set_xticklabels([str(i) for i in years_range])
-        self.ax.legend()
-
-        # Add grid
-        self.ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-
-        # Rotate labels
-        plt.setp(self.ax.get_xticklabels(), rotation=45, ha='right')
+        self.ax.set_xticklabels(self._xtick_labels(n_years), rotation=45, ha='right')
+        self.ax.legend().set_animated(True)
 
         # Adjust layout
         self.figure.tight_layout()
-        self.canvas.draw()
+        self._request_redraw()
+
+    def _bar_positions(self, n_years):
+        """Return the cached tick and bar x positions for a plot of n_years"""
+        positions = self._x_cache.get(n_years)
+        if positions is None:
+            x = np.arange(n_years)
+            positions = self._x_cache[n_years] = (x, x + self._OFF_LEFT, x + self._OFF_MID, x + self._OFF_RIGHT)
+        return positions
+
+    def _xtick_labels(self, n_years):
+        """Return the cached year labels for a plot of n_years"""
+        labels = self._xtick_cache.get(n_years)
+        if labels is None:
+            labels = self._xtick_cache[n_years] = [str(i) for i in range(1, n_years + 1)]
+        return labels
+
+    def _request_redraw(self):
+        """Schedule a full redraw; blitting resumes once it recaptures the background"""
+        self._bg = None
+        self.canvas.draw_idle()
+
+    def _remove_bars(self):
+        """Remove the bars and legend while keeping the axes and their styling"""
+        if self._bars is not None:
+            for container in self._bars.values():
+                container.remove()
+            self._bars = None
+
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+        # Forget the data limits of the removed bars
+        self.ax.relim()
+
+    def _set_bar_heights(self, series):
+        """Update the existing bar rectangles in place with new yearly values"""
+        for key, values in series.items():
+            for rect, height in zip(self._bars[key], values):
+                rect.set_height(height)
+
+        # Extra principal is stacked on top of the base principal
+        for rect, bottom in zip(self._bars['extra'], series['base']):
+            rect.set_y(bottom)
+
+    def _animate_overlays(self):
+        """Leave the y axis and spines out of full draws so they can be painted above the bars"""
+        self.ax.yaxis.set_animated(True)
+        for spine in self.ax.spines.values():
+            spine.set_animated(True)
+
+    def _draw_animated(self):
+        """Draw the animated artists in z-order: bars, y axis and grid, spines, legend"""
+        if self._bars is not None:
+            for container in self._bars.values():
+                for rect in container:
+                    self.ax.draw_artist(rect)
+        self.ax.draw_artist(self.ax.yaxis)
+        for spine in self.ax.spines.values():
+            self.ax.draw_artist(spine)
+        legend = self.ax.get_legend()
+        if legend is not None:
+            self.ax.draw_artist(legend)
+
+    def _blit_bars(self):
+        """Restore the cached background and repaint only the animated artists"""
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit()
+
+    def _on_resize(self, event):
+        """Drop the cached background; it no longer matches the canvas size"""
+        self._bg = None
+
+    def _on_draw(self, event):
+        """Cache the static background after every full draw"""
+        # savefig already draws animated artists in z-order and must not replace the background
+        if self.canvas.is_saving():
+            return
+        # The y tick labels sit outside the axes, so the whole figure is cached
+        self._bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _read_floats(self, names):
+        """Read and parse several numeric input fields in one pass"""
+        return {name: self.get_float_value(getattr(self, f"{name}_var").get() or "0")
+                for name in names}
 
     def get_float_value(self, value_str):
         """Convert string to float, handling commas/periods and invalid input"""
         try:
-            # Remove any currency symbols
-            cleaned_str = value_str.replace('kr', '').replace('$', '').strip()
-            # Replace comma with period for decimal numbers
-            cleaned_str = cleaned_str.replace(',', '.')
-            # Remove any additional periods (if more than one exists)
-            if cleaned_str.count('.') > 1:
-                first_period = cleaned_str.find('.')
-                cleaned_str = cleaned_str[:first_period + 1] + cleaned_str[first_period + 1:].replace('.', '')
-            if not cleaned_str:
-                return 0.0
-            return float(cleaned_str)
+            return _parse_float(value_str)
         except ValueError:
             raise ValueError(f"Invalid number format: {value_str}")
 
+    def _debounce(self, callback, delay=150):
+        """Coalesce a burst of trace callbacks into one call after typing pauses"""
+        pending = self._pending_updates.pop(callback, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def run():
+            self._pending_updates.pop(callback, None)
+            callback()
+
+        self._pending_updates[callback] = self.root.after(delay, run)
+
+    def _cancel_pending_updates(self):
+        """Cancel debounced trace updates that an explicit action supersedes"""
+        for pending in self._pending_updates.values():
+            self.root.after_cancel(pending)
+        self._pending_updates.clear()
+
     def update_on_loan_seeking_change(self, *args):
+        """Schedule a loan amount update when loan seeking amount changes"""
+        self._debounce(self._do_loan_seeking_update)
+
+    def _do_loan_seeking_update(self):
         """Update loan amount when loan seeking amount changes"""
         try:
             loan_seeking_str = self.loan_seeking_var.get().strip()
             if not loan_seeking_str:
-                self.down_payment_var.set("")
+                self._set_down_payment("")
                 self.loan_amount_var.set("")
                 return
 
@@ -767,8 +1065,8 @@ class MortgageCalculator:
                 if self.down_payment_mode.get() == "auto":
                     # Calculate 15% down payment for auto mode
                     down_payment = loan_seeking * 0.15
-                    self.down_payment_var.set(f"{down_payment:,.0f}")
-                    self.down_payment_entry.configure(state='disabled')
+                    self._set_down_payment(f"{down_payment:,.0f}")
+                    self._set_dp_state('disabled')
                     
                     # Calculate and store loan amount
                     loan_amount = loan_seeking - down_payment
@@ -780,32 +1078,53 @@ class MortgageCalculator:
                     self.current_values['loan_amount'] = float(loan_amount)
                 else:
                     # In manual mode, enable entry
-                    self.down_payment_entry.configure(state='normal')
+                    self._set_dp_state('normal')
                     # If down payment is empty or invalid, set it to 0
                     try:
                         down_payment = self.get_float_value(self.down_payment_var.get())
                         if down_payment <= 0:
-                            self.down_payment_var.set("0")
+                            self._set_down_payment("0")
                             down_payment = 0
                     except ValueError:
-                        self.down_payment_var.set("0")
+                        self._set_down_payment("0")
                         down_payment = 0
                     # Calculate loan amount
                     loan_amount = loan_seeking - down_payment
                     self.loan_amount_var.set(f"{loan_amount:,.0f}")
             else:
                 # Clear fields if loan seeking is not positive
-                self.down_payment_entry.configure(state='disabled')
-                self.down_payment_var.set("")
+                self._set_dp_state('disabled')
+                self._set_down_payment("")
                 self.loan_amount_var.set("")
 
         except ValueError:
             # Handle any conversion errors
-            self.down_payment_entry.configure(state='disabled')
-            self.down_payment_var.set("")
+            self._set_dp_state('disabled')
+            self._set_down_payment("")
             self.loan_amount_var.set("")
 
     def update_loan_amount(self, *args):
+        """Schedule a loan amount update when down payment changes"""
+        # Writes made by the calculator itself already update the loan amount
+        if self._setting_down_payment:
+            return
+        self._debounce(self._do_update_loan_amount)
+
+    def _set_down_payment(self, value):
+        """Set the down payment without re-triggering the loan amount trace"""
+        self._setting_down_payment = True
+        try:
+            self.down_payment_var.set(value)
+        finally:
+            self._setting_down_payment = False
+
+    def _set_dp_state(self, state):
+        """Configure the down payment entry state only when it changes"""
+        if state != self._dp_state:
+            self.down_payment_entry.configure(state=state)
+            self._dp_state = state
+
+    def _do_update_loan_amount(self):
         """Update loan amount when down payment changes"""
         try:
             loan_seeking = self.get_float_value(self.loan_seeking_var.get())
@@ -828,7 +1147,7 @@ class MortgageCalculator:
                     if loan_seeking > 0:
                         # Calculate and set 15% down payment
                         down_payment = loan_seeking * 0.15
-                        self.down_payment_var.set(f"{down_payment:,.0f}")
+                        self._set_down_payment(f"{down_payment:,.0f}")
                         
                         # Update loan amount and variables
                         loan_amount = loan_seeking - down_payment
@@ -840,10 +1159,10 @@ class MortgageCalculator:
                         self.current_values['loan_amount'] = float(loan_amount)
             except ValueError:
                 pass
-            self.down_payment_entry.configure(state='disabled')
+            self._set_dp_state('disabled')
         else:
             # Switch to manual mode
-            self.down_payment_entry.configure(state='normal')
+            self._set_dp_state('normal')
             try:
                 # Get current values
                 loan_seeking = self.get_float_value(self.loan_seeking_var.get() or "0")
@@ -851,7 +1170,7 @@ class MortgageCalculator:
                 
                 # Validate and set down payment
                 if down_payment <= 0:
-                    self.down_payment_var.set("0")
+                    self._set_down_payment("0")
                     down_payment = 0
                 
                 # Calculate and store loan amount
@@ -863,7 +1182,7 @@ class MortgageCalculator:
                 self.current_values['down_payment'] = float(down_payment)
                 self.current_values['loan_amount'] = float(loan_amount)
             except ValueError:
-                self.down_payment_var.set("0")
+                self._set_down_payment("0")
                 self.current_values['down_payment'] = 0.0
 
     def initialize_variables(self):
@@ -882,17 +1201,7 @@ class MortgageCalculator:
         self.monthly_fee_var = tk.StringVar(value="")
 
         # Result variables
-        self.monthly_payment_var = tk.StringVar(value="kr0")
-        self.total_interest_var = tk.StringVar(value="kr0")
-        self.monthly_principal_var = tk.StringVar(value="kr0")
-        self.monthly_extra_var = tk.StringVar(value="kr0")
-        self.monthly_total_principal_var = tk.StringVar(value="kr0")
-        self.monthly_interest_var = tk.StringVar(value="kr0")
-        self.monthly_fee_var = tk.StringVar(value="")  # Keep Monthly House Fee blank
-        self.monthly_total_var = tk.StringVar(value="kr0")
-        self.time_saved_var = tk.StringVar(value="0 years, 0 months")
-        self.interest_saved_var = tk.StringVar(value="kr0")
-        self.loan_payoff_time_var = tk.StringVar(value="0 years, 0 months")
+        self.initialize_display_variables()
 
         # Store current values for PDF export with proper initialization
         self.current_values = {
@@ -912,17 +1221,8 @@ class MortgageCalculator:
 
     def initialize_display_variables(self):
         """Initialize display variables for results"""
-        self.monthly_payment_var = tk.StringVar(value="kr0")
-        self.total_interest_var = tk.StringVar(value="kr0")
-        self.monthly_principal_var = tk.StringVar(value="kr0")
-        self.monthly_extra_var = tk.StringVar(value="kr0")
-        self.monthly_total_principal_var = tk.StringVar(value="kr0")
-        self.monthly_interest_var = tk.StringVar(value="kr0")
-        self.monthly_fee_var = tk.StringVar(value="")  # Keep Monthly House Fee blank
-        self.monthly_total_var = tk.StringVar(value="kr0")
-        self.time_saved_var = tk.StringVar(value="0 years, 0 months")
-        self.interest_saved_var = tk.StringVar(value="kr0")
-        self.loan_payoff_time_var = tk.StringVar(value="30 years, 0 months")
+        for name, value in _DEFAULT_DISPLAY:
+            setattr(self, name, tk.StringVar(value=value))
 
     def export_pdf(self):
         """Export results to PDF in landscape mode with plot"""
@@ -935,60 +1235,21 @@ class MortgageCalculator:
             current_date = datetime.now()
             base_filename = f'mortgage_calculation_{current_date.strftime("%d-%m-%Y")}'
 
-            # Check if file exists and create unique name
+            # Create unique name from a single listing of the exports directory
+            existing = set(os.listdir(export_dir))
             counter = 1
-            filename = os.path.join(export_dir, f'{base_filename}.pdf')
-            while os.path.exists(filename):
-                filename = os.path.join(export_dir, f'{base_filename}_{counter}.pdf')
+            pdf_name = f'{base_filename}.pdf'
+            while pdf_name in existing:
+                pdf_name = f'{base_filename}_{counter}.pdf'
                 counter += 1
+            filename = os.path.join(export_dir, pdf_name)
 
             # Create PDF in landscape mode
             width, height = landscape(A4)
             c = canvas.Canvas(filename, pagesize=landscape(A4))
 
-            # Create figure for PDF with specified size of 15x3.5 inches
-            pdf_fig = plt.Figure(figsize=(15, 3.5))
-            pdf_ax = pdf_fig.add_subplot(111)
-            pdf_fig.patch.set_facecolor('white')  # Ensure white background
-            
-            # Copy plot data and styling
-            x = self.ax.get_xticks()
-            width_bar = 0.2
-            
-            # Get data from current plot
-            for rect in self.ax.containers:
-                data = [p.get_height() for p in rect]
-                label = rect.get_label()
-                color = rect.get_children()[0].get_facecolor()
-                
-                if label == 'Base Principal':
-                    pdf_ax.bar(x - width_bar*0.5, data, width_bar, label=label, color=color)
-                elif label == 'Extra Principal':
-                    bottom = [p.get_height() for p in self.ax.containers[0]]
-                    pdf_ax.bar(x - width_bar*0.5, data, width_bar, label=label, color=color, bottom=bottom)
-                elif label == 'Interest':
-                    pdf_ax.bar(x + width_bar*0.5, data, width_bar, label=label, color=color)
-                elif label == 'Total':
-                    pdf_ax.bar(x + width_bar*1.5, data, width_bar, label=label, color=color)
-            
-            # Copy styling
-            pdf_ax.set_ylabel(self.ax.get_ylabel())
-            pdf_ax.set_xlabel(self.ax.get_xlabel())
-            pdf_ax.set_xticks(x)
-            pdf_ax.set_xticklabels([str(i+1) for i in range(len(x))])
-            pdf_ax.legend()
-            pdf_ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-            plt.setp(pdf_ax.get_xticklabels(), rotation=45, ha='right')
-            
-            # Add title for print version
-            pdf_ax.set_title('Mortgage Payment Breakdown by Year', pad=20)
-            
-            # Adjust layout
-            pdf_fig.tight_layout()
-            
-            # Convert plot to PNG for PDF inclusion
-            plot_filename = 'temp_plot.png'
-            pdf_fig.savefig(plot_filename, dpi=300, bbox_inches='tight')
+            # Render the on-screen chart at print size for PDF inclusion
+            plot_image = ImageReader(self._render_print_chart())
 
             # Title
             c.setFont("Helvetica-Bold", 18)
@@ -1032,9 +1293,7 @@ class MortgageCalculator:
                 f"Interest Rate: {self.interest_rate_var.get()}%"
             ]
             
-            for detail in details:
-                c.drawString(left_col_x + 20, y, detail)
-                y -= 15
+            y = self._draw_lines(c, left_col_x + 20, y, details)
 
             # Monthly Payment Breakdown (continuing in left column)
             y -= 10
@@ -1052,9 +1311,7 @@ class MortgageCalculator:
                 f"Total Monthly Payment: {self.monthly_total_var.get()}"
             ]
             
-            for item in breakdown:
-                c.drawString(left_col_x + 20, y, item)
-                y -= 15
+            y = self._draw_lines(c, left_col_x + 20, y, breakdown)
 
             # Right Column
             y = height - 100
@@ -1070,9 +1327,7 @@ class MortgageCalculator:
                 f"Interest Saved: {self.interest_saved_var.get()}"
             ]
             
-            for item in extra_payments:
-                c.drawString(right_col_x + 20, y, item)
-                y -= 15
+            y = self._draw_lines(c, right_col_x + 20, y, extra_payments)
 
             # Loan Payoff Time
             y -= 10
@@ -1089,7 +1344,7 @@ class MortgageCalculator:
             plot_y = plot_margin + 40  # Leave space for the note at bottom
             
             # Draw the plot with preserved aspect ratio
-            c.drawImage(plot_filename, plot_margin, plot_y,
+            c.drawImage(plot_image, plot_margin, plot_y,
                        width=plot_width, height=plot_height,
                        preserveAspectRatio=True)
 
@@ -1106,22 +1361,35 @@ class MortgageCalculator:
             
             c.save()
             
-            try:
-                # Clean up temporary plot file
-                os.remove(plot_filename)
-            except Exception:
-                pass  # Ignore cleanup errors
-            
             messagebox.showinfo("Success", f"PDF exported successfully to:\n{filename}")
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export PDF: {str(e)}")
-            try:
-                # Clean up temporary file if it exists
-                if os.path.exists('temp_plot.png'):
-                    os.remove('temp_plot.png')
-            except Exception:
-                pass  # Ignore cleanup errors
+
+    def _render_print_chart(self):
+        """Render the chart at 15x3.5 inches with a title into an in-memory PNG"""
+        screen_size = self.figure.get_size_inches()
+        self.figure.set_size_inches(15, 3.5, forward=False)
+        self.ax.set_title('Mortgage Payment Breakdown by Year', pad=20)
+        try:
+            self.figure.tight_layout()
+            plot_buffer = io.BytesIO()
+            self.figure.savefig(plot_buffer, format='png', dpi=150, bbox_inches='tight')
+        finally:
+            self.ax.set_title('')
+            self.figure.set_size_inches(screen_size, forward=False)
+            self.figure.tight_layout()
+            self._request_redraw()
+        plot_buffer.seek(0)
+        return plot_buffer
+
+    def _draw_lines(self, c, x, y, lines, leading=15):
+        """Draw a block of lines as a single PDF text object and return the next y"""
+        text = c.beginText(x, y)
+        text.setFont("Helvetica", 10, leading=leading)
+        text.textLines(lines)
+        c.drawText(text)
+        return y - leading * len(lines)
 
     def update_extra_payments_info(self, time_saved, interest_saved):
         """Update the extra payments information display"""
@@ -1130,29 +1398,38 @@ class MortgageCalculator:
 
     def clear_displays(self):
         """Clear all display fields"""
-        currency = self.currency_var.get()
-        self.monthly_payment_var.set(f"{currency}0")
-        self.total_interest_var.set(f"{currency}0")
-        self.monthly_principal_var.set(f"{currency}0")
-        self.monthly_extra_var.set(f"{currency}0")
-        self.monthly_total_principal_var.set(f"{currency}0")
-        self.monthly_interest_var.set(f"{currency}0")
-        self.monthly_fee_var.set("")  # Keep Monthly House Fee blank
-        self.monthly_total_var.set(f"{currency}0")
-        self.time_saved_var.set("0 years, 0 months")
-        self.interest_saved_var.set(f"{currency}0")
-        self.loan_payoff_time_var.set("30 years, 0 months")
+        zero = f"{self.currency_var.get()}0"
+        pairs = (
+            (self.monthly_payment_var, zero),
+            (self.total_interest_var, zero),
+            (self.monthly_principal_var, zero),
+            (self.monthly_extra_var, zero),
+            (self.monthly_total_principal_var, zero),
+            (self.monthly_interest_var, zero),
+            (self.monthly_fee_var, ""),  # Keep Monthly House Fee blank
+            (self.monthly_total_var, zero),
+            (self.time_saved_var, "0 years, 0 months"),
+            (self.interest_saved_var, zero),
+            (self.loan_payoff_time_var, "30 years, 0 months"),
+        )
+        # Skip vars that already hold their cleared value so Tk doesn't fire their traces
+        for var, value in pairs:
+            if var.get() != value:
+                var.set(value)
 
     def clear_fields(self):
         """Clear all input fields and reset displays"""
         # Clear input fields
         self.loan_seeking_var.set("")
-        self.down_payment_var.set("")
+        self._set_down_payment("")
         self.interest_rate_var.set("4.5")  # Reset interest rate to default
         self.principal_payment_var.set("")
         self.extra_payment_var.set("")
         self.monthly_fee_var.set("")
 
+        # Inputs were reset explicitly, so drop the trace updates they queued
+        self._cancel_pending_updates()
+
         # Reset currency to default
         self.currency_var.set('kr')
         self.currency_name_var.set("Swedish Krona (SEK)")
@@ -1165,11 +1442,12 @@ class MortgageCalculator:
 
         # Clear visualization with empty plot
         self.ax.clear()
+        self._bars = None
         self.ax.set_xlabel('Year')
         self.ax.set_ylabel('Amount')
         self.ax.grid(True, axis='y', linestyle='--', alpha=0.7)
         self.figure.tight_layout()
-        self.canvas.draw()
+        self._request_redraw()
 
 # STEP 13: Main Function
 def main():